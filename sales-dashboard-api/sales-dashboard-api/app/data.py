@@ -4,16 +4,20 @@ Data Module
 Handles data generation, filtering, and aggregation for the sales dashboard.
 In a production app, this would connect to a database or external API.
 For this demo, we generate realistic sample data.
+
+Records are stored column-wise (one NumPy array per field) rather than as a
+list of dicts, so filters are boolean masks and totals are array sums.
 """
 
-import random
-from datetime import datetime, timedelta
-from typing import Optional
+import csv
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Optional, Union
 import numpy as np
 
 # Seed for consistent data across restarts
-random.seed(42)
-np.random.seed(42)
+RANDOM_SEED = 42
 
 # Configuration
 MARKETS = ["Austin", "Dallas", "Houston", "San Antonio", "Fort Worth"]
@@ -21,98 +25,362 @@ ACCOUNTS = ["Tom Thumb", "Kroger", "Central Market", "Whole Foods", "Market Stre
 BRANDS = ["Moët & Chandon", "Hennessy", "Veuve Clicquot", "Dom Pérignon", "Belvedere"]
 REPS = ["Martinez, J", "Thompson, K", "Williams, R", "Garcia, M", "Johnson, T"]
 
-# Generate base dataset once at startup
-_DATA_CACHE = None
+BASE_DATE = np.datetime64("2026-01-01", "D")
+NUM_WEEKS = 8
+DAYS_PER_WEEK = 7
+
+# Weeks covered by the generated dataset
+AVAILABLE_WEEKS = list(range(1, NUM_WEEKS + 1))
+
+# Market name -> int code used in SalesColumns.market
+MARKET_INDEX = {market: i for i, market in enumerate(MARKETS)}
+
+# Each market has different baseline performance (same order as MARKETS)
+MARKET_MULTIPLIER = np.array([0.95, 1.2, 1.1, 0.85, 0.9])
+
+# Code -> name lookup arrays, so decoding a column is one gather
+_MARKET_NAMES = np.array(MARKETS, dtype=object)
+_ACCOUNT_NAMES = np.array(ACCOUNTS, dtype=object)
+_BRAND_NAMES = np.array(BRANDS, dtype=object)
+_REP_NAMES = np.array(REPS, dtype=object)
+
+
+@dataclass(slots=True)
+class SalesRow:
+    """
+    A single decoded sales record, as returned by /api/sales.
+
+    Slotted so each row carries no per-instance __dict__; orjson serializes
+    dataclass instances to JSON objects natively.
+    """
+    date: str
+    week: int
+    market: str
+    account: str
+    brand: str
+    rep: str
+    goal: int
+    sales_volume: int
+    displays: int
+    pods: int
+    voids: int
+
+
+@dataclass
+class SalesColumns:
+    """
+    Sales records stored as parallel arrays (one entry per record).
+
+    Text fields (market, account, brand, rep) hold small integer codes that
+    index into MARKETS, ACCOUNTS, BRANDS and REPS respectively.
+    """
+    date: np.ndarray          # datetime64[D]
+    week: np.ndarray          # int8, week 1 starts on BASE_DATE
+    market: np.ndarray        # int8, index into MARKETS
+    account: np.ndarray       # int8, index into ACCOUNTS
+    brand: np.ndarray         # int8, index into BRANDS
+    rep: np.ndarray           # int8, index into REPS
+    goal: np.ndarray          # int32
+    sales_volume: np.ndarray  # int32
+    displays: np.ndarray      # int8
+    pods: np.ndarray          # int8
+    voids: np.ndarray         # int8
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    def to_columns(self, mask: Optional[np.ndarray] = None) -> dict[str, list]:
+        """
+        Decode records into one Python list per field.
 
+        Args:
+            mask: Optional boolean mask or index array selecting records
 
-def _generate_sample_data() -> list[dict]:
+        Returns:
+            Dictionary of field name -> list of values, text fields decoded
+        """
+        if mask is None:
+            mask = slice(None)
+
+        return {
+            "date": self.date[mask].astype(str).tolist(),
+            "week": self.week[mask].tolist(),
+            "market": _MARKET_NAMES[self.market[mask]].tolist(),
+            "account": _ACCOUNT_NAMES[self.account[mask]].tolist(),
+            "brand": _BRAND_NAMES[self.brand[mask]].tolist(),
+            "rep": _REP_NAMES[self.rep[mask]].tolist(),
+            "goal": self.goal[mask].tolist(),
+            "sales_volume": self.sales_volume[mask].tolist(),
+            "displays": self.displays[mask].tolist(),
+            "pods": self.pods[mask].tolist(),
+            "voids": self.voids[mask].tolist(),
+        }
+
+    def to_records(self, mask: Optional[np.ndarray] = None) -> list[SalesRow]:
+        """
+        Materialize records as SalesRow objects for the API response.
+
+        Args:
+            mask: Optional boolean mask or index array selecting records
+
+        Returns:
+            List of SalesRow records with text fields decoded
+        """
+        columns = self.to_columns(mask)
+        return [SalesRow(*row) for row in zip(*columns.values())]
+
+
+def _build_columns() -> SalesColumns:
     """
     Generate realistic sample sales data.
-    
-    Creates ~500 records across multiple weeks, markets, and accounts.
-    """
-    global _DATA_CACHE
-    
-    if _DATA_CACHE is not None:
-        return _DATA_CACHE
-    
-    data = []
-    
-    # Generate data for weeks 1-8 of 2026
-    base_date = datetime(2026, 1, 1)
-    
-    for week in range(1, 9):
-        week_start = base_date + timedelta(weeks=week-1)
-        
-        for market in MARKETS:
-            # Each market has different baseline performance
-            market_multiplier = {
-                "Dallas": 1.2,
-                "Houston": 1.1,
-                "Austin": 0.95,
-                "San Antonio": 0.85,
-                "Fort Worth": 0.9,
-            }.get(market, 1.0)
-            
-            for account in ACCOUNTS:
-                for day_offset in range(7):
-                    current_date = week_start + timedelta(days=day_offset)
-                    
-                    # Generate realistic numbers
-                    base_goal = int(random.randint(800, 1500) * market_multiplier)
-                    
-                    # Sales typically 85-115% of goal with some variance
-                    attainment = random.gauss(1.0, 0.15)
-                    sales = int(base_goal * max(0.5, min(1.5, attainment)))
-                    
-                    # Displays affect performance
-                    displays = random.randint(0, 4)
-                    if displays > 0:
-                        # Displays boost sales by 5-10% each
-                        display_lift = 1 + (displays * random.uniform(0.05, 0.10))
-                        sales = int(sales * display_lift)
-                    
-                    data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "week": week,
-                        "market": market,
-                        "account": account,
-                        "brand": random.choice(BRANDS),
-                        "rep": random.choice(REPS),
-                        "goal": base_goal,
-                        "sales_volume": sales,
-                        "displays": displays,
-                        "pods": random.randint(0, 3),
-                        "voids": random.randint(0, 2),
-                    })
-    
-    _DATA_CACHE = data
-    return data
+
+    Creates 1,400 records (8 weeks x 5 markets x 5 accounts x 7 days). All
+    random fields are drawn in bulk, one RNG call per field.
+    """
+    rng = np.random.default_rng(RANDOM_SEED)
+
+    # Lay out one record per (week, market, account, day), in that nesting
+    # order, for weeks 1-8 of 2026
+    n_markets = len(MARKETS)
+    n_accounts = len(ACCOUNTS)
+    week_col = np.repeat(AVAILABLE_WEEKS, n_markets * n_accounts * DAYS_PER_WEEK)
+    market_col = np.tile(np.repeat(np.arange(n_markets), n_accounts * DAYS_PER_WEEK), NUM_WEEKS)
+    account_col = np.tile(np.repeat(np.arange(n_accounts), DAYS_PER_WEEK), NUM_WEEKS * n_markets)
+    day_col = np.tile(np.arange(DAYS_PER_WEEK), NUM_WEEKS * n_markets * n_accounts)
+    day_offsets = (week_col - 1) * DAYS_PER_WEEK + day_col
+    n = len(week_col)
+
+    # Generate realistic numbers
+    goal = (rng.integers(800, 1500, size=n, endpoint=True) * MARKET_MULTIPLIER[market_col]).astype(np.int32)
+
+    # Sales typically 85-115% of goal with some variance
+    attainment = np.clip(rng.normal(1.0, 0.15, size=n), 0.5, 1.5)
+    sales = (goal * attainment).astype(np.int32)
+
+    # Displays boost sales by 5-10% each
+    displays = rng.integers(0, 4, size=n, endpoint=True)
+    display_lift = 1 + displays * rng.uniform(0.05, 0.10, size=n)
+    sales = (sales * display_lift).astype(np.int32)
+
+    return SalesColumns(
+        date=BASE_DATE + day_offsets.astype("timedelta64[D]"),
+        week=week_col.astype(np.int8),
+        market=market_col.astype(np.int8),
+        account=account_col.astype(np.int8),
+        brand=rng.integers(0, len(BRANDS), size=n).astype(np.int8),
+        rep=rng.integers(0, len(REPS), size=n).astype(np.int8),
+        goal=goal,
+        sales_volume=sales,
+        displays=displays.astype(np.int8),
+        pods=rng.integers(0, 3, size=n, endpoint=True).astype(np.int8),
+        voids=rng.integers(0, 2, size=n, endpoint=True).astype(np.int8),
+    )
+
+
+# Canonical store for the generated dataset, built once at import
+COLUMNS = _build_columns()
+
+
+@dataclass
+class SalesTotals:
+    """
+    Pre-aggregated totals used by the dashboard endpoints.
+
+    The *_by_week tables are indexed [week, market_code]; the *_by_day tables
+    are indexed [day_offset, market_code] with day_offset counted from
+    BASE_DATE. The counts tables record how many records fed each cell, so
+    empty cells can be told apart from cells that sum to zero.
+    """
+    sales_by_week: np.ndarray  # int64
+    goal_by_week: np.ndarray   # int64
+    count_by_week: np.ndarray  # int64
+    sales_by_day: np.ndarray   # int64
+    count_by_day: np.ndarray   # int64
+
+
+def _sum_cells(
+    cells: np.ndarray,
+    n_rows: int,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Sum weights (or count records) into an [n_rows, market] table.
+
+    Args:
+        cells: Flat cell index per record (row * len(MARKETS) + market code)
+        n_rows: Number of table rows
+        weights: Values to sum per cell; counts records when omitted
+
+    Returns:
+        int64 table of shape (n_rows, len(MARKETS))
+    """
+    size = n_rows * len(MARKETS)
+    totals = np.bincount(cells, weights=weights, minlength=size)
+    return totals.astype(np.int64).reshape(n_rows, len(MARKETS))
+
+
+def _build_totals(cols: SalesColumns) -> SalesTotals:
+    """
+    Sum the dataset into per-(week, market) and per-(day, market) tables.
+
+    The dataset never changes after it is generated, so every endpoint can
+    answer from these small tables instead of scanning the records.
+    """
+    n_weeks = int(cols.week.max()) + 1
+    days = (cols.date - BASE_DATE).astype(np.int64)
+    n_days = int(days.max()) + 1
+
+    # Flatten each (row, market) cell to one index so every table is a
+    # single bincount pass over the records
+    week_cells = cols.week.astype(np.int64) * len(MARKETS) + cols.market
+    day_cells = days * len(MARKETS) + cols.market
+
+    sales_by_week = _sum_cells(week_cells, n_weeks, cols.sales_volume)
+    goal_by_week = _sum_cells(week_cells, n_weeks, cols.goal)
+    count_by_week = _sum_cells(week_cells, n_weeks)
+    sales_by_day = _sum_cells(day_cells, n_days, cols.sales_volume)
+    count_by_day = _sum_cells(day_cells, n_days)
+
+    return SalesTotals(
+        sales_by_week=sales_by_week,
+        goal_by_week=goal_by_week,
+        count_by_week=count_by_week,
+        sales_by_day=sales_by_day,
+        count_by_day=count_by_day,
+    )
+
+
+TOTALS = _build_totals(COLUMNS)
+
+
+def _filter_mask(
+    cols: SalesColumns,
+    week: Optional[int] = None,
+    markets: Optional[list[str]] = None,
+) -> np.ndarray:
+    """Build a boolean mask selecting records for a week and set of markets."""
+    mask = np.ones(len(cols), dtype=bool)
+
+    if week is not None:
+        mask &= cols.week == week
+
+    if markets:
+        market_ids = np.fromiter(
+            (MARKET_INDEX[m] for m in markets if m in MARKET_INDEX),
+            dtype=np.int8,
+        )
+        mask &= np.isin(cols.market, market_ids)
+
+    return mask
+
+
+def _market_key(markets: Optional[list[str]]) -> Optional[tuple[int, ...]]:
+    """
+    Normalize a market filter into a hashable cache key.
+
+    Returns None when no filter applies, otherwise the sorted, de-duplicated
+    market codes (empty if none of the names are known markets).
+    """
+    if not markets:
+        return None
+    return tuple(sorted({MARKET_INDEX[m] for m in markets if m in MARKET_INDEX}))
+
+
+def _week_rows(table: np.ndarray, week: Optional[int]) -> np.ndarray:
+    """Select the rows of a per-week table for a week filter."""
+    if week is None:
+        return table
+    if not 0 <= week < table.shape[0]:
+        return table[:0]
+    return table[week:week + 1]
+
+
+def _week_days(week: Optional[int]) -> slice:
+    """
+    Day offsets (from BASE_DATE) covered by a week filter.
+
+    Weeks are derived from dates, with week 1 starting on BASE_DATE, so a
+    week is always a contiguous run of rows in the per-day tables.
+    """
+    if week is None:
+        return slice(None)
+    if week < 1:
+        return slice(0, 0)
+    return slice((week - 1) * DAYS_PER_WEEK, week * DAYS_PER_WEEK)
+
+
+def _market_columns(market_key: Optional[tuple[int, ...]]) -> Union[slice, list[int]]:
+    """Column index into a per-market table for a normalized market filter."""
+    return slice(None) if market_key is None else list(market_key)
 
 
 def get_sales_data(
     week: Optional[int] = None,
     market: Optional[str] = None,
-) -> list[dict]:
+) -> list[SalesRow]:
     """
     Get filtered sales data.
-    
+
     Args:
         week: Filter by ISO week number
         market: Filter by market name
-        
+
     Returns:
         List of sales records matching filters
     """
-    data = _generate_sample_data()
-    
-    if week is not None:
-        data = [d for d in data if d["week"] == week]
-    
-    if market is not None:
-        data = [d for d in data if d["market"] == market]
-    
-    return data
+    mask = _filter_mask(COLUMNS, week, [market] if market is not None else None)
+    return COLUMNS.to_records(mask)
+
+
+def get_sales_columns(
+    week: Optional[int] = None,
+    market: Optional[str] = None,
+) -> dict[str, list]:
+    """
+    Get filtered sales data in column-oriented form.
+
+    Args:
+        week: Filter by ISO week number
+        market: Filter by market name
+
+    Returns:
+        Dictionary of field name -> list of values for matching records
+    """
+    mask = _filter_mask(COLUMNS, week, [market] if market is not None else None)
+    return COLUMNS.to_columns(mask)
+
+
+def iter_sales_csv(
+    week: Optional[int] = None,
+    markets: Optional[list[str]] = None,
+    chunk_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Stream filtered sales data as CSV text.
+
+    Args:
+        week: Filter by week number
+        markets: List of markets to include
+        chunk_size: Number of rows written per yielded chunk
+
+    Yields:
+        The header plus the first chunk of rows, then further row chunks.
+        Nothing is yielded when no records match.
+    """
+    indices = np.flatnonzero(_filter_mask(COLUMNS, week, markets))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # Decode one chunk at a time so only chunk_size rows exist as Python objects
+    for start in range(0, len(indices), chunk_size):
+        columns = COLUMNS.to_columns(indices[start:start + chunk_size])
+        if start == 0:
+            writer.writerow(columns)
+        writer.writerows(zip(*columns.values()))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
 
 
 def get_summary_metrics(
@@ -121,36 +389,35 @@ def get_summary_metrics(
 ) -> dict:
     """
     Calculate aggregated summary metrics.
-    
+
     Args:
         week: Filter by week number
         markets: List of markets to include
-        
+
     Returns:
         Dictionary with total_sales, total_goal, gap_to_goal, attainment
     """
-    data = _generate_sample_data()
-    
-    # Apply filters
-    if week is not None:
-        data = [d for d in data if d["week"] == week]
-    
-    if markets:
-        data = [d for d in data if d["market"] in markets]
-    
-    if not data:
+    return dict(_summary_metrics(week, _market_key(markets)))
+
+
+@lru_cache(maxsize=128)
+def _summary_metrics(week: Optional[int], market_key: Optional[tuple[int, ...]]) -> dict:
+    """Cached body of get_summary_metrics, keyed on the normalized filter."""
+    columns = _market_columns(market_key)
+
+    if not _week_rows(TOTALS.count_by_week, week)[:, columns].any():
         return {
             "total_sales": 0,
             "total_goal": 0,
             "gap_to_goal": 0,
             "attainment": 0,
         }
-    
-    total_sales = sum(d["sales_volume"] for d in data)
-    total_goal = sum(d["goal"] for d in data)
+
+    total_sales = int(_week_rows(TOTALS.sales_by_week, week)[:, columns].sum())
+    total_goal = int(_week_rows(TOTALS.goal_by_week, week)[:, columns].sum())
     gap_to_goal = total_goal - total_sales
     attainment = (total_sales / total_goal * 100) if total_goal > 0 else 0
-    
+
     return {
         "total_sales": total_sales,
         "total_goal": total_goal,
@@ -162,37 +429,36 @@ def get_summary_metrics(
 def get_territory_summary(week: Optional[int] = None) -> list[dict]:
     """
     Get summary by territory (market) for the bar chart.
-    
+
     Returns list of markets with their attainment percentages.
     """
-    data = _generate_sample_data()
-    
-    if week is not None:
-        data = [d for d in data if d["week"] == week]
-    
+    return [dict(row) for row in _territory_summary(week)]
+
+
+@lru_cache(maxsize=128)
+def _territory_summary(week: Optional[int]) -> list[dict]:
+    """Cached body of get_territory_summary."""
+
     # Aggregate by market
-    market_totals = {}
-    for record in data:
-        market = record["market"]
-        if market not in market_totals:
-            market_totals[market] = {"sales": 0, "goal": 0}
-        market_totals[market]["sales"] += record["sales_volume"]
-        market_totals[market]["goal"] += record["goal"]
-    
-    # Calculate attainment for each market
+    counts = _week_rows(TOTALS.count_by_week, week).sum(axis=0)
+    market_sales = _week_rows(TOTALS.sales_by_week, week).sum(axis=0)
+    market_goal = _week_rows(TOTALS.goal_by_week, week).sum(axis=0)
+
     result = []
-    for market, totals in market_totals.items():
-        attainment = (totals["sales"] / totals["goal"] * 100) if totals["goal"] > 0 else 0
+    for market_id in np.flatnonzero(counts).tolist():
+        sales = int(market_sales[market_id])
+        goal = int(market_goal[market_id])
+        attainment = (sales / goal * 100) if goal > 0 else 0
         result.append({
-            "market": market,
-            "sales": totals["sales"],
-            "goal": totals["goal"],
+            "market": MARKETS[market_id],
+            "sales": sales,
+            "goal": goal,
             "attainment": round(attainment, 1),
         })
-    
+
     # Sort by attainment descending
     result.sort(key=lambda x: x["attainment"], reverse=True)
-    
+
     return result
 
 
@@ -202,36 +468,35 @@ def get_daily_trend(
 ) -> list[dict]:
     """
     Get daily sales totals for the trend line chart.
-    
+
     Returns list of dates with total sales for each day.
     """
-    data = _generate_sample_data()
-    
-    if week is not None:
-        data = [d for d in data if d["week"] == week]
-    
-    if markets:
-        data = [d for d in data if d["market"] in markets]
-    
-    # Aggregate by date
-    daily_totals = {}
-    for record in data:
-        date = record["date"]
-        if date not in daily_totals:
-            daily_totals[date] = 0
-        daily_totals[date] += record["sales_volume"]
-    
-    # Convert to sorted list
+    return [dict(row) for row in _daily_trend(week, _market_key(markets))]
+
+
+@lru_cache(maxsize=128)
+def _daily_trend(week: Optional[int], market_key: Optional[tuple[int, ...]]) -> list[dict]:
+    """Cached body of get_daily_trend, keyed on the normalized filter."""
+    columns = _market_columns(market_key)
+
+    # Rows of the per-day tables are indexed by day offset, i.e. already in
+    # date order, so the result needs no sort and dates are formatted last
+    day_rows = _week_days(week)
+    counts = TOTALS.count_by_day[day_rows][:, columns].sum(axis=1)
+    daily_totals = TOTALS.sales_by_day[day_rows][:, columns].sum(axis=1)
+    day_offsets = np.arange(len(TOTALS.count_by_day))[day_rows]
+
+    days = np.flatnonzero(counts)
+    dates = (BASE_DATE + day_offsets[days]).astype(str).tolist()
+
     result = [
         {"date": date, "sales": total}
-        for date, total in sorted(daily_totals.items())
+        for date, total in zip(dates, daily_totals[days].tolist())
     ]
-    
+
     return result
 
 
 def get_available_weeks() -> list[int]:
     """Get list of unique weeks in the dataset."""
-    data = _generate_sample_data()
-    weeks = sorted(set(d["week"] for d in data))
-    return weeks
+    return list(AVAILABLE_WEEKS)
@@ -11,22 +11,41 @@ To run in production:
     uvicorn app.main:app --host 0.0.0.0 --port $PORT
 """
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from fastapi.responses import JSONResponse
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Callable, Literal, Optional
+import gzip
 import logging
+import orjson
 
-from app.data import get_sales_data, get_summary_metrics, get_territory_summary, get_daily_trend
+from app.data import MARKETS, get_available_weeks as list_available_weeks, get_sales_columns, get_sales_data, get_summary_metrics, get_territory_summary, get_daily_trend, iter_sales_csv
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a payload to compact UTF-8 JSON (numpy scalars allowed)."""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+    
+    def render(self, content: Any) -> bytes:
+        return _dump_json(content)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Sales Dashboard API",
     description="API for CPWS Sales Performance Dashboard",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS (allows frontend to call this API)
@@ -40,6 +59,142 @@ app.add_middleware(
 )
 
 
+VALID_MARKETS = frozenset(MARKETS)
+
+
+def _parse_markets(markets: Optional[str]) -> Optional[tuple[str, ...]]:
+    """
+    Parse and validate a comma-separated markets parameter.
+    
+    Returns a sorted, de-duplicated tuple of market names (usable as a cache
+    key), or None when no markets are given. Unknown names are rejected with
+    a 400 rather than silently matching nothing.
+    """
+    if not markets:
+        return None
+    
+    names = {m.strip() for m in markets.split(",")} - {""}
+    unknown = names - VALID_MARKETS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown market(s): {', '.join(sorted(unknown))}",
+        )
+    
+    return tuple(sorted(names)) or None
+
+
+def _json_response(content: bytes) -> Response:
+    """Wrap already-serialized JSON in a response."""
+    return Response(content=content, media_type="application/json")
+
+
+def _summary_json(week: Optional[int], markets: Optional[tuple[str, ...]]) -> bytes:
+    market_list = list(markets) if markets else None
+    return _dump_json(get_summary_metrics(week=week, markets=market_list))
+
+
+def _territory_json(week: Optional[int]) -> bytes:
+    return _dump_json({"data": get_territory_summary(week=week)})
+
+
+def _trend_json(week: Optional[int], markets: Optional[tuple[str, ...]]) -> bytes:
+    market_list = list(markets) if markets else None
+    return _dump_json({"data": get_daily_trend(week=week, markets=market_list)})
+
+
+def _weeks_json() -> bytes:
+    return _dump_json({"weeks": list_available_weeks()})
+
+
+@lru_cache(maxsize=64)
+def _sales_json(week: Optional[int], market: Optional[str], columnar: bool) -> bytes:
+    if columnar:
+        data = get_sales_columns(week=week, market=market)
+        return _dump_json({"data": data, "count": len(data["week"])})
+    data = get_sales_data(week=week, market=market)
+    return _dump_json({"data": data, "count": len(data)})
+
+
+GZIP_LEVEL = 6
+
+
+def _build_response_cache() -> dict[tuple, tuple[bytes, bytes]]:
+    """
+    Serialize every dashboard response up front, plain and gzip-compressed.
+    
+    The dataset never changes after startup and the filter space is small
+    (each week or all weeks, times each subset of markets), so every
+    summary, territory, trend and weeks body can be built once at import.
+    Keys match the normalized query parameters, e.g.
+    ("summary", week, markets) with markets as returned by _parse_markets.
+    """
+    weeks = [None, *list_available_weeks()]
+    market_sets = [None] + [
+        tuple(sorted(subset))
+        for size in range(1, len(MARKETS) + 1)
+        for subset in combinations(MARKETS, size)
+    ]
+    
+    bodies = {("weeks",): _weeks_json()}
+    for week in weeks:
+        bodies[("territory", week)] = _territory_json(week)
+        for markets in market_sets:
+            bodies[("summary", week, markets)] = _summary_json(week, markets)
+            bodies[("trend", week, markets)] = _trend_json(week, markets)
+    
+    return {
+        key: (body, gzip.compress(body, compresslevel=GZIP_LEVEL))
+        for key, body in bodies.items()
+    }
+
+
+_RESPONSE_CACHE = _build_response_cache()
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether the client's Accept-Encoding allows gzip."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        
+        # "gzip;q=0" explicitly refuses gzip
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _cached_response(request: Request, key: tuple, build: Callable[[], bytes]) -> Response:
+    """
+    Serve a prebuilt response body.
+    
+    Bodies come from _RESPONSE_CACHE, gzipped when the client accepts it.
+    Keys outside the cache (e.g. a week with no data) are built on demand.
+    """
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is None:
+        return _json_response(build())
+    
+    body, gzipped = cached
+    if _accepts_gzip(request):
+        return Response(
+            content=gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
 @app.get("/")
 def root():
     """Health check endpoint."""
@@ -50,6 +205,9 @@ def root():
 def get_sales(
     week: Optional[int] = Query(None, description="ISO week number to filter by"),
     market: Optional[str] = Query(None, description="Market to filter by"),
+    output_format: Literal["records", "columnar"] = Query(
+        "records", alias="format", description="Row records or one list per field"
+    ),
 ):
     """
     Get raw sales data with optional filters.
@@ -57,17 +215,19 @@ def get_sales(
     Parameters:
     - week: Filter by ISO week number (1-52)
     - market: Filter by market name (Austin, Dallas, Houston, San Antonio)
+    - format: "records" (default) for a list of row objects, or "columnar"
+      for one list per field, e.g. {"date": [...], "week": [...], ...}
     
     Returns:
-    - List of sales records
+    - Sales records and their count
     """
-    logger.info(f"GET /api/sales - week={week}, market={market}")
-    data = get_sales_data(week=week, market=market)
-    return {"data": data, "count": len(data)}
+    logger.info(f"GET /api/sales - week={week}, market={market}, format={output_format}")
+    return _json_response(_sales_json(week, market, output_format == "columnar"))
 
 
 @app.get("/api/summary")
 def get_summary(
+    request: Request,
     week: Optional[int] = Query(None, description="ISO week number"),
     markets: Optional[str] = Query(None, description="Comma-separated list of markets"),
 ):
@@ -81,18 +241,17 @@ def get_summary(
     - attainment: Percentage of goal achieved
     """
     logger.info(f"GET /api/summary - week={week}, markets={markets}")
-    
-    # Parse comma-separated markets into list
-    market_list = None
-    if markets:
-        market_list = [m.strip() for m in markets.split(",")]
-    
-    summary = get_summary_metrics(week=week, markets=market_list)
-    return summary
+    market_names = _parse_markets(markets)
+    return _cached_response(
+        request,
+        ("summary", week, market_names),
+        lambda: _summary_json(week, market_names),
+    )
 
 
 @app.get("/api/territory")
 def get_territory(
+    request: Request,
     week: Optional[int] = Query(None, description="ISO week number"),
 ):
     """
@@ -101,12 +260,12 @@ def get_territory(
     Returns list of markets with their attainment percentages.
     """
     logger.info(f"GET /api/territory - week={week}")
-    data = get_territory_summary(week=week)
-    return {"data": data}
+    return _cached_response(request, ("territory", week), lambda: _territory_json(week))
 
 
 @app.get("/api/trend")
 def get_trend(
+    request: Request,
     week: Optional[int] = Query(None, description="ISO week number"),
     markets: Optional[str] = Query(None, description="Comma-separated list of markets"),
 ):
@@ -116,25 +275,22 @@ def get_trend(
     Returns daily sales totals for the specified week.
     """
     logger.info(f"GET /api/trend - week={week}, markets={markets}")
-    
-    market_list = None
-    if markets:
-        market_list = [m.strip() for m in markets.split(",")]
-    
-    data = get_daily_trend(week=week, markets=market_list)
-    return {"data": data}
+    market_names = _parse_markets(markets)
+    return _cached_response(
+        request,
+        ("trend", week, market_names),
+        lambda: _trend_json(week, market_names),
+    )
 
 
 @app.get("/api/weeks")
-def get_available_weeks():
+def get_available_weeks(request: Request):
     """
     Get list of available weeks in the dataset.
     
     Used to populate the week selector dropdown.
     """
-    from app.data import get_available_weeks
-    weeks = get_available_weeks()
-    return {"weeks": weeks}
+    return _cached_response(request, ("weeks",), _weeks_json)
 
 
 @app.get("/api/download")
@@ -143,28 +299,13 @@ def download_sales(
     markets: Optional[str] = Query(None),
 ):
     """Export filtered sales data as CSV."""
-    import io
-    import csv
     from fastapi.responses import StreamingResponse
     
-    market_list = [m.strip() for m in markets.split(",")] if markets else None
-    data = get_sales_data(week=week)
-    
-    # Filter by markets if provided
-    if market_list:
-        data = [d for d in data if d["market"] in market_list]
-        
-    if not data:
-        return StreamingResponse(io.StringIO(""), media_type="text/csv")
-        
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=data[0].keys())
-    writer.writeheader()
-    writer.writerows(data)
-    output.seek(0)
+    market_names = _parse_markets(markets)
+    market_list = list(market_names) if market_names else None
     
     return StreamingResponse(
-        output, 
+        iter_sales_csv(week=week, markets=market_list),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=sales_export.csv"}
     )